@@ -104,6 +104,32 @@ def test_shared_threaded_resource():
     assert thread_out_nonsharable == "a"
 
 
+def test_shared_threaded_resource_created_by_two_threads_at_once():
+    import threading
+
+    # Makes both threads construct the dependency at the same time.
+    barrier = threading.Barrier(2, timeout=5)
+
+    class ThreadSharableDependency(Dependency):
+        def __init__(self):
+            barrier.wait()
+
+    thread_out = [None, None]
+
+    def thread_func(index):
+        thread_out[index] = ThreadSharableDependency.grab()
+
+    threads = [threading.Thread(target=thread_func, args=[i]) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert thread_out[0] is not None
+    assert thread_out[0] is thread_out[1]
+    assert ThreadSharableDependency.grab() is thread_out[0]
+
+
 def test_dep_as_decorator():
     @dataclasses.dataclass
     class MyDep(Dependency):
@@ -122,6 +148,40 @@ def test_dep_as_decorator():
     assert my_func() == 'new-value'
 
 
+def test_blank_globals_let_previous_dependencies_be_collected():
+    import contextvars
+    import gc
+    import weakref
+
+    class MyDep(DependencyPerThread):
+        pass
+
+    def grab_dep_and_blank_globals():
+        dep = weakref.ref(MyDep.grab())
+        _setup_blank_app_and_thread_root_contexts_globals()
+        return dep
+
+    # Our own `contextvars.Context`, which (unlike the one the test runs in)
+    # does not have a thread-root context held by the `xinject_test_context` fixture.
+    context = contextvars.Context()
+    previous_dep = context.run(grab_dep_and_blank_globals)
+    gc.collect()
+    assert previous_dep() is None
+
+
+def test_blank_globals_reach_threads_that_outlive_them():
+    from concurrent.futures import ThreadPoolExecutor
+
+    class MyDep(DependencyPerThread):
+        pass
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        previous_dep = executor.submit(MyDep.grab).result()
+        _setup_blank_app_and_thread_root_contexts_globals()
+        # Same worker thread, but it should now get a new thread-root context.
+        assert executor.submit(MyDep.grab).result() is not previous_dep
+
+
 def test_proxy_attribute():
     @dataclasses.dataclass
     class MyData:
@@ -142,3 +202,201 @@ def test_proxy_attribute():
 
     # Original MyData object is restored
     assert proxy__my_data.some_data == 'data-value'
+
+    assert MyDep.proxy_attribute('my_data') is proxy__my_data
+
+    class MySubDep(MyDep):
+        pass
+
+    assert MySubDep.proxy_attribute('my_data') is not proxy__my_data
+
+    # A dotted name is looked up as a single attribute, not as nested attributes.
+    setattr(MyDep.grab(), 'my_data.some_data', 'dotted-value')
+    assert MyDep.proxy_attribute('my_data.some_data').upper() == 'DOTTED-VALUE'
+
+
+def test_proxy_wrap_returns_same_proxy():
+    assert CurrentDependencyProxy.wrap(MyClass) is my_class
+    assert MyClass.proxy() is my_class_via_proxy_method
+    assert MyClass.proxy() is my_class
+
+    class MySubClass(MyClass):
+        pass
+
+    assert MySubClass.proxy() is not my_class
+    assert MySubClass.proxy() is MySubClass.proxy()
+
+    # Proxies share their (specialized) class, one is not created for each dependency type.
+    assert type(MySubClass.proxy()) is type(my_class)
+
+
+def test_proxy_wrap_non_dependency_type():
+    with pytest.raises(Exception, match='Must pass a xinject.Dependency subtype'):
+        CurrentDependencyProxy.wrap(int)
+
+
+def test_proxy_class_subscript():
+    assert CurrentDependencyProxy[MyClass] is CurrentDependencyProxy
+    proxy: CurrentDependencyProxy[MyClass] = MyClass.proxy()
+    assert proxy.my_method() == "b"
+
+
+def test_proxy_specialized_with_grabber():
+    proxy = CurrentDependencyProxy._specialize(MyClass, grabber=lambda x: x.my_prop)
+    assert isinstance(proxy, CurrentDependencyProxy)
+    assert proxy.upper() == "B"
+    with MyClass() as my_obj:
+        my_obj.my_prop = "c"
+        assert proxy.upper() == "C"
+        assert str(proxy) == "c"
+        assert proxy[0] == "c"
+
+
+def test_proxy_subclass_overrides_used_by_wrap():
+    class MyProxy(CurrentDependencyProxy):
+        def _get_active(self):
+            return "overridden"
+
+    proxy = MyProxy.wrap(MyClass)
+    assert type(proxy) is MyProxy
+    assert proxy.upper() == "OVERRIDDEN"
+
+
+def test_proxy_subclass_init_with_only_dependency_type():
+    class MyProxy(CurrentDependencyProxy):
+        def __init__(self, dependency_type):
+            super().__init__(dependency_type)
+
+    assert MyProxy.wrap(MyClass).my_method() == "b"
+
+
+def test_proxy_pickle_and_copy():
+    import pickle
+    from copy import copy
+    from operator import attrgetter
+
+    proxies = [
+        MyClass.proxy(),
+        MyClass.proxy_attribute('my_prop'),
+        CurrentDependencyProxy(MyClass, repr_info='custom'),
+        CurrentDependencyProxy(MyClass, grabber=attrgetter('my_prop', 'my_method')),
+        CurrentDependencyProxy._specialize(
+            MyClass, grabber=attrgetter('my_prop'), repr_info='custom'
+        ),
+    ]
+
+    for proxy in proxies:
+        for proxy_copy in (pickle.loads(pickle.dumps(proxy)), copy(proxy)):
+            assert type(proxy_copy) is type(proxy)
+            assert proxy_copy._dependency_type is MyClass
+            assert proxy_copy._repr_info == proxy._repr_info
+            assert repr(proxy_copy) == repr(proxy)
+            assert proxy_copy._get_active() == proxy._get_active()
+
+
+def test_dependency_class_arguments_inherited_by_subclass():
+    from xinject.dependency import (
+        is_dependency_thread_sharable, attributes_to_skip_while_copying
+    )
+
+    class ParentDep(Dependency, attributes_to_skip_while_copying=['a']):
+        pass
+
+    class ChildDep(ParentDep, thread_sharable=False, attributes_to_skip_while_copying=['b']):
+        pass
+
+    assert is_dependency_thread_sharable(ParentDep)
+    assert not is_dependency_thread_sharable(ChildDep)
+    assert not is_dependency_thread_sharable(DependencyPerThread)
+    assert attributes_to_skip_while_copying(ParentDep()) == {'a'}
+    assert attributes_to_skip_while_copying(ChildDep()) == {'a', 'b'}
+
+    class GrandChildDep(ChildDep):
+        pass
+
+    assert not is_dependency_thread_sharable(GrandChildDep)
+    assert attributes_to_skip_while_copying(GrandChildDep()) == {'a', 'b'}
+
+    # Callers get their own (modifiable) set.
+    attributes_to_skip_while_copying(GrandChildDep()).add('c')
+    assert attributes_to_skip_while_copying(GrandChildDep()) == {'a', 'b'}
+    assert GrandChildDep._dependency__meta is ChildDep._dependency__meta
+
+
+def test_copy_skips_attributes():
+    from copy import copy, deepcopy
+
+    class MyDep(Dependency, attributes_to_skip_while_copying=['skipped']):
+        pass
+
+    dep = MyDep()
+    dep.skipped = 'skipped-value'
+    dep.kept = ['kept-value']
+
+    with dep:
+        for dep_copy in (copy(dep), deepcopy(dep)):
+            assert not hasattr(dep_copy, 'skipped')
+            assert dep_copy.kept == ['kept-value']
+            assert dep_copy.kept is not dep.kept
+            assert dep_copy._context_manager_stack is None
+
+
+def test_obj_class_property():
+    from unittest import mock
+
+    class MyDep(Dependency):
+        pass
+
+    assert MyDep.obj is MyDep.grab()
+    assert MyDep().obj is MyDep.grab()
+
+    with MyDep() as my_dep:
+        assert MyDep.obj is my_dep
+
+    class MyOverridingDep(Dependency):
+        @classmethod
+        def grab(cls):
+            return 'overridden'
+
+    assert MyOverridingDep.obj == 'overridden'
+
+    with mock.patch.object(MyDep, 'grab', return_value='mocked'):
+        assert MyDep.obj == 'mocked'
+
+
+def test_dep_entered_again_before_exiting():
+    class MyDep(Dependency):
+        pass
+
+    my_dep = MyDep()
+    with my_dep:
+        first_context = XContext.grab()
+        with my_dep:
+            assert XContext.grab() is not first_context
+            assert MyDep.grab() is my_dep
+        assert XContext.grab() is first_context
+        assert MyDep.grab() is my_dep
+
+        with my_dep:
+            assert XContext.grab().parent is first_context
+        assert XContext.grab() is first_context
+
+    assert MyDep.grab() is not my_dep
+    assert not my_dep._context_manager_stack
+
+
+def test_deepcopy_leaves_out_attributes_that_cant_be_copied():
+    import threading
+    from copy import deepcopy
+
+    class MyDep(Dependency):
+        pass
+
+    dep = MyDep()
+    dep.lock = threading.Lock()
+    dep.value = {'a': 1}
+
+    dep_copy = deepcopy(dep)
+    assert not hasattr(dep_copy, 'lock')
+    assert dep_copy.value == {'a': 1}
+    assert dep_copy.value is not dep.value
@@ -307,10 +307,12 @@ with statement.
 import contextvars
 import itertools
 import functools
-from typing import TypeVar, Type, Dict, List, Optional, Union, Any, Iterable, Set
+import threading
+from typing import (
+    TypeVar, Type, Dict, List, Tuple, Optional, Union, Any, Iterable, Set, Callable
+)
 from copy import copy
 from xsentinels.default import Default, DefaultType
-from xsentinels.singleton import Singleton
 from xinject.errors import XInjectError
 
 T = TypeVar('T')
@@ -337,13 +339,20 @@ __pdoc__ = {
 _ContextCounter = itertools.count()
 
 
-class _TreatAsRootParentType(Singleton):
+class _TreatAsRootParentType:
     """
     Use `TreatAsRootParent`. This class is an implementation detail,
-    to ensure that there is ever only one `TreatAsRootParent` value.
+    only one `TreatAsRootParent` value is ever created (below, at module level).
     I based this off how None works in Python [ie: a None + NoneType]
+
+    It's only ever compared by identity, so unlike `xsentinels.default.Default` it does not
+    need to be a `xsentinels.singleton.Singleton` (it's private, no one else creates one).
     """
-    pass
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return '_TreatAsRootParent'
 
 
 _TreatAsRootParent = _TreatAsRootParentType()
@@ -375,6 +384,42 @@ _TreatAsRootParent = _TreatAsRootParentType()
 """
 
 
+# The error messages for `XContext.parent` live in these functions and not in the property its
+# self, to keep its bytecode small; it's called for every context while walking a parent-chain.
+
+def _raise_active_context_without_parent(context: 'XContext'):
+    raise XInjectError(
+        f"Somehow we have a XContext has been activated "
+        f"(ie: has activated via decorator `@` or via `with` "
+        f"at some point and has not exited yet) "
+        f"but still has it's internal parent value set to ({context._parent}). "
+        f"This indicates some sort of programming error or bug with XContext. "
+        f"An active XContext should NEVER have their parent set at `Default`. "
+        f"It should either be None or an explict parent XContext instance "
+        # Can't resolve parent, would create infinite recursion.
+        f"({context.__repr__(include_parent=False)}). "
+        f"A XContext should either have an explicit parent or a parent of `None` after "
+        f"XContext has been activated via `@` or `with` or activating a "
+        f"`xinject.dependency.Dependency` via `@` or `with` "
+        f"(side note: you can look at XContext._is_active doc-comment for more internal "
+        f"details)."
+    )
+
+
+def _raise_inactive_context_with_explicit_parent(context: 'XContext'):
+    raise XInjectError(
+        f"Somehow we have a XContext that is not active "
+        f"(ie: ever activated via decorator `@` or via `with` or activating a "
+        f"`xinject.dependency.Dependency` via `@` or `with`) but has a specific parent "
+        f"(ie: not None or _TreatAsRootParent or Default). "
+        f"This indicates some sort of programming error or bug with XContext. "
+        f"A XContext should only have an explicit parent if they have "
+        f"been activated via `@` or `with` or activating a `xinject.dependency.Dependency` "
+        f"via `@` or `with` "
+        f"(side note: you can look at XContext._is_active for more internal details)."
+    )
+
+
 class XContext:
     """
     See [Quick Start](#quick-start) in the `xinject.context` module if your new to the XContext
@@ -387,22 +432,42 @@ class XContext:
         Gets the current `XContext` that should be used by default. It does this by calling
         `XContext.current`.
         """
-        context = _current_context_contextvar.get()
+        context = _get_current_context()
+        if context is not None:
+            return context
 
         # If we are None, we need to create the 'root-context' for current thread.
-        if context is None:
-            import threading
-            context = XContext(name=f'ThreadRoot-{threading.current_thread().name}')
-            context._make_current_and_get_reset_token(is_thread_root_context=True)
+        return cls._make_thread_root_context()
 
+    @classmethod
+    def _make_thread_root_context(cls) -> 'XContext':
+        """
+        Creates and activates the root-context for the current thread.
+
+        Kept out of `XContext.grab` so its common path
+        (a current context already exists) stays a single `ContextVar` read.
+
+        We deliberately don't cache the current context in a `threading.local`;
+        several asyncio tasks can run on the same thread, each with their own current context.
+        Only the `ContextVar` knows which one is current.
+        """
+        context = XContext(name=f'ThreadRoot-{threading.current_thread().name}')
+        context._make_current_and_get_reset_token(is_thread_root_context=True)
         return context
 
     @classmethod
     def current(cls, for_type: Type[C]) -> C:
         """ Gets the current context that should be used by default, via the Python 3.7 ContextVar
             feature. Please see XContext class doc [just above] for more details on how this works.
+
+            `xinject.dependency.Dependency.grab` does not go though here, it directly reads the
+            current context and looks in its dependencies to skip the `for_type is XContext` check
+            and extra calls on the hot path of getting a dependency.
         """
-        context = cls.grab()
+        # Same as `XContext.grab`, inlined to avoid the extra call when a context already exists.
+        context = _get_current_context()
+        if context is None:
+            context = cls._make_thread_root_context()
 
         if for_type is XContext:
             return context
@@ -411,7 +476,7 @@ class XContext:
 
     @classmethod
     def _current_without_creating_thread_root(cls):
-        return _current_context_contextvar.get()
+        return _get_current_context()
 
     def _make_current_and_get_reset_token(
         self,
@@ -471,11 +536,36 @@ class XContext:
         #
         # We return the reset token, but it's only used internally when calling this method.
         # outside people should ignore token.
-        my_parent = self._parent
-        if my_parent and not my_parent._is_root_context_for_app:
-            my_parent._children.add(self)
-
-        return _current_context_contextvar.set(self)
+        #
+        # We don't add ourselves to our parent's `_children` here; that only needs to happen
+        # once we cache something from our parent-chain (see `XContext._add_self_to_parents`).
+        return _set_current_context(self)
+
+    def _add_self_to_parents(self):
+        """ Adds self into our parent's `_children`, and our parent into their parent's and so on
+            (stopping at the app-root, or once a context is found to already be in its parent).
+
+            `XContext._remove_cached_dependency_and_in_children` walks `_children` to remove
+            stale cached values when a dependency is added to a context. Only contexts with
+            something cached (or with a child that does) need to be reachable that way;
+            so this is called the first time we cache something from our parent-chain,
+            instead of every time a context is activated.
+        """
+        child = self
+        parent = self._parent
+        while parent is not None and not parent._is_root_context_for_app:
+            children = parent._children
+            if children is None:
+                # A plain set is much cheaper to add to/discard from than a `WeakSet`;
+                # a child removes itself when it's exited (see `XContext.__exit__`).
+                children = parent._children = set()
+            elif child in children:
+                # Parent was already added to its parents when `child` was added to it.
+                return
+
+            children.add(child)
+            child = parent
+            parent = parent._parent
 
     @property
     def parent(self) -> Optional["XContext"]:
@@ -488,23 +578,7 @@ class XContext:
                 return parent
 
             # `parent` is most likely still set as `Default`.
-
-            raise XInjectError(
-                f"Somehow we have a XContext has been activated "
-                f"(ie: has activated via decorator `@` or via `with` "
-                f"at some point and has not exited yet) "
-                f"but still has it's internal parent value set to ({parent}). "
-                f"This indicates some sort of programming error or bug with XContext. "
-                f"An active XContext should NEVER have their parent set at `Default`. "
-                f"It should either be None or an explict parent XContext instance "
-                # Can't resolve parent, would create infinite recursion.
-                f"({self.__repr__(include_parent=False)}). "
-                f"A XContext should either have an explicit parent or a parent of `None` after "
-                f"XContext has been activated via `@` or `with` or activating a "
-                f"`xinject.dependency.Dependency` via `@` or `with` "
-                f"(side note: you can look at XContext._is_active doc-comment for more internal "
-                f"details)."
-            )
+            _raise_active_context_without_parent(self)
 
         # If we are not 'active' (ie: via `with` or `make_current()` or decorator `@`)
         # and we have our internal parent set to `Default`;
@@ -517,20 +591,10 @@ class XContext:
         if parent is Default:
             return XContext.grab()
 
-        if parent in (_TreatAsRootParent, None):
+        if parent is None or parent is _TreatAsRootParent:
             return None
 
-        raise XInjectError(
-            f"Somehow we have a XContext that is not active "
-            f"(ie: ever activated via decorator `@` or via `with` or activating a "
-            f"`xinject.dependency.Dependency` via `@` or `with`) but has a specific parent "
-            f"(ie: not None or _TreatAsRootParent or Default). "
-            f"This indicates some sort of programming error or bug with XContext. "
-            f"A XContext should only have an explicit parent if they have "
-            f"been activated via `@` or `with` or activating a `xinject.dependency.Dependency` "
-            f"via `@` or `with` "
-            f"(side note: you can look at XContext._is_active for more internal details)."
-        )
+        _raise_inactive_context_with_explicit_parent(self)
 
     @property
     def name(self) -> str:
@@ -540,11 +604,14 @@ class XContext:
 
             May allow customization in the future.
         """
-        return self._name
+        # Name is only needed for debugging, so it's only turned into a `str` when asked for.
+        if suffix := self._name_suffix:
+            return f'{self._name_id}-{suffix}'
+        return str(self._name_id)
 
     def __init__(
             self, __func=None, *,
-            dependencies: Union[Dict[Type, Any], List[Any], Any] = None,
+            dependencies: Union[Dict[Type, Any], List[Any], Tuple[Any, ...], Any] = None,
             parent: Union[DefaultType, _TreatAsRootParentType, None] = Default,
             name: str = None
     ):
@@ -575,7 +642,7 @@ class XContext:
                 `XContext` your creating have an initial list of dependencies you can pass them
                 in here.
 
-                It can be a single Dependency, or a list of dependencies, or a mapping of
+                It can be a single Dependency, or a list/tuple of dependencies, or a mapping of
                 dependencies.
 
                 Mainly useful for unit-testing, but could be useful elsewhere too.
@@ -646,6 +713,15 @@ class XContext:
                 "when you do use XContext directly as a decorator, "
                 "ie: `@XContext` (notice no parens at end)."
             )
+
+        if parent is not Default and parent is not None and parent is not _TreatAsRootParent:
+            raise XInjectError(
+                "You must only pass in `Default` or `None` or `_TreatAsRootParentType` for parent "
+                f"when creating a new XContext, got ({parent}) instead."
+            )
+
+        self._setup_blank_state(parent=parent, name=name)
+
         self._func = __func
         if __func:
             # Make our class appear to be '__func', ie: we are wrapping __func
@@ -654,41 +730,18 @@ class XContext:
             # >>> @XContext  # <-- notice not parens at end "()"
             # >>> def some_method():
             # ...     pass
+            #
+            # The decorated function's `__dict__` is merged into ours too
+            # (ie: `pytest.mark` decorators applied under us still apply);
+            # our own internal attributes are in `__slots__`, so it can't clobber them.
             functools.update_wrapper(self, __func)
 
-        # Unique sequential number.
-        self._name = str(next(_ContextCounter))
-        if name:
-            self._name = f'{self._name}-{name}'
-
-        self._reset_token_stack = []
-        self._dependencies = {}
-        self._parent = None
-        self._cached_parent_dependencies = {}
-        self._children = set()
-
-        if parent is Default:
-            self._parent = Default
-            self._originally_passed_none_for_parent = False
-        elif parent is None:
-            self._parent = None
-            self._originally_passed_none_for_parent = True
-        elif parent is _TreatAsRootParent:
-            self._parent = _TreatAsRootParent
-            self._originally_passed_none_for_parent = False
-            self._is_root_like_context = True
-        else:
-            raise XInjectError(
-                "You must only pass in `Default` or `None` or `_TreatAsRootParentType` for parent "
-                f"when creating a new XContext, got ({parent}) instead."
-            )
-
         # Add any requested initial dependencies.
         if isinstance(dependencies, dict):
             # We have a mapping, use that....
             for for_type, resource in dependencies.items():
                 self.add(resource, for_type=for_type)
-        elif isinstance(dependencies, list):
+        elif isinstance(dependencies, (list, tuple)):
             # We have one or more Dependency values, add each one.
             for resource in dependencies:
                 self.add(resource)
@@ -696,6 +749,55 @@ class XContext:
             # Otherwise, we have a single Dependency value.
             self.add(dependencies)
 
+    @classmethod
+    def _new_blank(
+            cls, parent: Union[DefaultType, _TreatAsRootParentType, None] = Default
+    ) -> 'XContext':
+        """
+        Used internally to quickly create a new blank `XContext` with `parent`.
+
+        Skips the argument handling `XContext.__init__` does for outside callers
+        (decorated function, initial dependencies, name and validating `parent`),
+        so `parent` must be one of the values `XContext.__init__` accepts.
+
+        Used on paths that create short-lived contexts, such as copying a context to activate it
+        and using a `xinject.dependency.Dependency` in a `with` statement.
+        """
+        context = cls.__new__(cls)
+        context._setup_blank_state(parent=parent)
+        context._func = None
+        return context
+
+    def _setup_blank_state(
+            self, parent: Union[DefaultType, _TreatAsRootParentType, None], name: str = None
+    ):
+        """ Sets every internal attribute (see `XContext.__slots__`) to what a new, blank
+            and inactive `XContext` with `parent` should have.
+            `parent` should already have been validated by caller.
+        """
+        # Unique sequential number, and optional name to append to it (see `XContext.name`).
+        self._name_id = next(_ContextCounter)
+        self._name_suffix = name
+
+        self._dependencies = {}
+        self._lookup = self._dependencies
+        self._parent = parent
+        self._originally_passed_none_for_parent = parent is None
+        self._is_root_like_context = parent is _TreatAsRootParent
+
+        # The reset-token stack, parent-dependency cache and children are allocated lazily,
+        # most contexts are never activated or never have a child activated under them.
+        self._reset_token = None
+        self._reset_token_stack = None
+        self._cached_parent_dependencies = None
+        self._cached_context_chain = None
+        self._children = None
+
+        self._sibling = None
+        self._is_active = False
+        self._is_root_context_for_app = False
+        self._is_root_context_for_thread = False
+
     # todo: Make it so if there is a parent context, and the current config has no property
     # todo: it can ask the XContext for the parent config to see if it has what is needed.
     def add(
@@ -771,10 +873,14 @@ class XContext:
         if for_type is None:
             for_type = type(dependency)
 
-        self._dependencies[for_type] = dependency
-        if self._sibling:
-            self._sibling.add(dependency, for_type=for_type)
-        self._remove_cached_dependency_and_in_children(for_type)
+        # Also add it to our sibling, and their sibling and so on (see `XContext.__enter__`).
+        context = self
+        while context is not None:
+            context._dependencies[for_type] = dependency
+            if context._lookup is not context._dependencies:
+                context._lookup[for_type] = dependency
+            context._remove_cached_dependency_and_in_children(for_type)
+            context = context._sibling
         return self
 
     def dependency(
@@ -861,13 +967,9 @@ class XContext:
                 If `False`: only returns an object if we have it already, otherwise None.
         """
 
-        # If we find it in self, use that; no need to check anything else...
-        obj = self._dependencies.get(for_type, None)
-        if obj is not None:
-            return obj
-
-        # We next check our cached parent deps...
-        obj = self._cached_parent_dependencies.get(for_type, None)
+        # If we find it in self or our cached parent deps, use that;
+        # no need to check anything else...
+        obj = self._lookup.get(for_type, None)
         if obj is not None:
             return obj
 
@@ -893,62 +995,80 @@ class XContext:
         # So, code using a Dependency in general should never have to worry about this None case.
 
         if self._is_root_context_for_app:
-            from xinject.dependency import is_dependency_thread_sharable
             if not is_dependency_thread_sharable(for_type):
                 return None
 
-        parent_value = None
+        # Walk up our parent-chain for the dependency, stopping at the first context that has it
+        # (in itself or in its cached parent deps); this is a simple loop over the `_parent` links
+        # instead of recursively asking each parent via `dependency()`.
+        #
+        # `XContext.parent` resolves a `Default` parent into the current context for us.
+        # Every context after self is active (an inactive context can't have an explicit parent),
+        # so their `_parent` is either another context or None.
+        #
+        # `looked_in` are the contexts we looked in that don't have it, in parent-chain order.
+        looked_in = [self]
         parent = self.parent
+        while parent is not None:
+            # The app-root will only hold thread-sharable dependencies (see above);
+            # if it's not sharable, the context right before the app-root
+            # (normally the thread-root context) is the last place to look and where we create it.
+            if parent._is_root_context_for_app and not is_dependency_thread_sharable(for_type):
+                break
+
+            obj = parent._lookup.get(for_type)
+            if obj is not None:
+                break
+
+            looked_in.append(parent)
+            parent = parent._parent
+
+        if obj is None:
+            # If we can't create the dependency, we should also not put any value in
+            # any context; simply return None.
+            if not create:
+                return None
 
-        # Sanity check: If we are active we should have a None or an explicit, non-default parent.
-        if self._is_active and parent is Default:
-            raise XInjectError(
-                "We somehow have a XContext that has been 'activated' but yet has "
-                "their parent still set to `Default`. This is a bug. Active XContext's "
-                "should NEVER have their parent set at `Default`. It should either be None "
-                f"or an explict parent XContext instance, problem instance: {self}"
-            )
-
-        # If we have a Default parent, then lookup current parent and use them for our 'Parent'.
-        if parent is Default:
-            # An active parent's will never have their self._parent set as Default;
-            # The current context is `active` along with it's parent-chain....
-            # So this should be safe.
-            # Doing an assert here to at least minimally double check this.
-            parent = XContext.grab()
-            if self is parent:
-                raise XInjectError(
-                    f"Somehow have self ({self}) and parent as same instance (XContext), "
-                    f"when self is not currently active and is attempting to find the current "
-                    f"active XContext to use as it's temporary parent."
-                )
-            assert self is not parent, "Somehow have self and parent as same instance."
-
-            # Since our `parent is Default`, we should not be the app-root, or thread-root
-            # context; we also don't want to cache anything our parent retrieves so simply
-            # return whatever our Default parent returns.
-            return parent.dependency(for_type, create=create)
-
-        if parent:
-            parent_value = parent.dependency(for_type, create=create)
-
-        # If we can't create the dependency, we can ask the resoruce to potetially create more of
-        # its self.
-        # We should also not put any value we find in self either.
-        # Simply return the parent_value, whatever it is (None or otherwise)
-        if not create:
-            return parent_value
-
-        # We next create dependency if we don't have an existing one.
-        # Allocate a blank object if we have no parent-value to use.
-        if parent_value is None:
-            obj = for_type()
-            self._dependencies[for_type] = obj
-            return obj
-
-        # Store in self for future reuse.
-        self._cached_parent_dependencies[for_type] = parent_value
-        return parent_value
+            # We next create dependency, since we don't have an existing one.
+            # It's allocated in the last context we looked in, just like if each context
+            # had asked its parent for it.
+            context = looked_in.pop()
+
+            # Another thread could create it in the same context while we do
+            # (ie: a thread-sharable dependency in the app-root context); use `setdefault` so
+            # everyone ends up with the one that was stored first.
+            dependencies = context._dependencies
+            obj = dependencies.setdefault(for_type, for_type())
+            lookup = context._lookup
+            if lookup is not dependencies:
+                lookup[for_type] = obj
+
+        # Store whatever the parent-chain found in each context before the one that has it
+        # for future reuse, even if we were asked to not create it; it already exists, and a
+        # context's parent-chain won't change while it has a parent. If a dependency is later
+        # added to a parent, it will remove these cached values
+        # (see `XContext._remove_cached_dependency_and_in_children`).
+        #
+        # If self has a `Default` parent, we are not the app-root, or thread-root context;
+        # we don't want to cache anything our dynamically looked-up parent retrieves.
+        newly_caching = None
+        for index in range(1 if self._parent is Default else 0, len(looked_in)):
+            context = looked_in[index]
+            cached = context._cached_parent_dependencies
+            if cached is None:
+                cached = context._cached_parent_dependencies = {}
+                lookup = context._lookup = context._dependencies.copy()
+                if newly_caching is None:
+                    newly_caching = context
+            else:
+                lookup = context._lookup
+            cached[for_type] = obj
+            lookup[for_type] = obj
+
+        if newly_caching is not None:
+            # Adds its parents to their parents too, so only needs to be done for the first one.
+            newly_caching._add_self_to_parents()
+        return obj
 
     def resource_chain(
             self, for_type: Type[ResourceTypeVar], create: bool = False
@@ -997,6 +1117,22 @@ class XContext:
             objs_already_seen.add(resource_id)
             yield resource
 
+    def dependency_chain_list(
+            self, for_type: Type[ResourceTypeVar], create: bool = False
+    ) -> List[ResourceTypeVar]:
+        """
+        Same as `XContext.dependency_chain`, except this returns a `list` of the dependencies
+        (ie: for when you want all of them anyway).
+
+        Args:
+            for_type (Type[ResourceTypeVar]): The dependency type to look for.
+            create (bool): If we should create dependency at each context if it does not already
+                exist.
+        Returns:
+            List[ResourceTypeVar]: Resources that were found in the self/parent hierarchy.
+        """
+        return list(self.dependency_chain(for_type=for_type, create=create))
+
     def __copy__(self):
         """ Makes a shallow copy of self.
 
@@ -1019,7 +1155,6 @@ class XContext:
             to how their parent values in their copies are treated.
             See `_TreatAsRootParent` for more details on this aspect.
         """
-        from xinject import Dependency
         # Use None for parent if we were originally created with a `None` parent.
         parent = Default
         if self._parent is _TreatAsRootParent:
@@ -1030,11 +1165,10 @@ class XContext:
             parent = None
 
         # Blank context with the same parent configuration
-        new_context = XContext(parent=parent)
+        new_context = XContext._new_blank(parent=parent)
 
-        new_context._dependencies = self._dependencies.copy()
-        # Reset context chain cache, if anything was cached in it.
-        new_context._reset_caches()
+        # A blank context has nothing cached; only need to point its lookup at the copied deps.
+        new_context._dependencies = new_context._lookup = self._dependencies.copy()
         return new_context
 
     def __deepcopy__(self, memo):
@@ -1104,14 +1238,15 @@ class XContext:
         #   raise an error.
 
         token = new_ctx._make_current_and_get_reset_token()
-        self._reset_token_stack.append(token)
+        self._push_reset_token(token)
         return new_ctx
 
     def __exit__(self, *args, **kwargs):
         # Makes it possible to use a XContext object in a `with XContext():` statement.
-        token = self._reset_token_stack.pop()
+        token = self._pop_reset_token()
 
-        current_context = XContext.grab()
+        # We (or our sibling copy) are the current context, so there is always one.
+        current_context = _get_current_context()
 
         if current_context._sibling:
             assert current_context._sibling is self, (
@@ -1124,7 +1259,7 @@ class XContext:
             )
             context_to_deactivate = self
 
-        assert not context_to_deactivate._reset_token_stack, (
+        assert context_to_deactivate._reset_token is None, (
             f"A XContext ({self}) was exited, and there was still a reset-token on stack."
         )
 
@@ -1138,11 +1273,17 @@ class XContext:
         _current_context_contextvar.reset(token)
 
         context_to_deactivate._is_active = False
-        context_to_deactivate._reset_caches()
-
-        if context_to_deactivate._parent:
-            # Remove self from children, reset parent/caches.
-            context_to_deactivate._parent._children.remove(context_to_deactivate)
+        if (
+            context_to_deactivate._cached_parent_dependencies is not None
+            or context_to_deactivate._cached_context_chain is not None
+        ):
+            # Most short-lived contexts have nothing cached to reset.
+            context_to_deactivate._reset_caches()
+
+        if parent := context_to_deactivate._parent:
+            # Remove self from children (if we were added), reset parent/caches.
+            if parent._children:
+                parent._children.discard(context_to_deactivate)
             context_to_deactivate._parent = Default
 
         assert not context_to_deactivate._children, (
@@ -1150,6 +1291,25 @@ class XContext:
             f"({context_to_deactivate._children})."
         )
 
+    def _push_reset_token(self, token: contextvars.Token):
+        """ Most contexts are only entered once at a time, so the most recent token is kept
+            in `XContext._reset_token`; a list is only allocated to hold older tokens when we
+            are entered again before being exited (ie: recursive use of a decorated function).
+        """
+        previous_token = self._reset_token
+        if previous_token is not None:
+            if self._reset_token_stack is None:
+                self._reset_token_stack = []
+            self._reset_token_stack.append(previous_token)
+        self._reset_token = token
+
+    def _pop_reset_token(self) -> contextvars.Token:
+        """ Returns the token from the most recent `XContext._push_reset_token`. """
+        token = self._reset_token
+        stack = self._reset_token_stack
+        self._reset_token = stack.pop() if stack else None
+        return token
+
     def __call__(self, *args, **kwargs):
         """
         This allows us to support using `xinject.context.XContext` as a function decorator in a
@@ -1299,13 +1459,15 @@ class XContext:
 
         chain = [self]
 
-        # This will resolve Default parent if needed, or give us back out explicit parent;
-        # or a None if we originally got passed a None for our parent when we were created.
-        current_context = self.parent
+        # Root contexts (ie: the app-root or a root-like context) have no parent to resolve.
+        parent = self._parent
+        if parent is not None and parent is not _TreatAsRootParent:
+            # This will resolve Default parent if needed, or give us back out explicit parent.
+            current_context = self.parent
 
-        while current_context:
-            chain.append(current_context)
-            current_context = current_context.parent
+            while current_context:
+                chain.append(current_context)
+                current_context = current_context.parent
 
         if self._is_active:
             # It's safe to cache parent-chain if we are active, our parent won't change
@@ -1315,13 +1477,13 @@ class XContext:
         return chain
 
     def __repr__(self, include_parent=True):
-        types_list = list(self._dependencies.keys())
-        if types_list and len(types_list) < 3:
-            types_list = [t.__name__ for t in types_list]
-            types = ';'.join(types_list)
+        dependencies = self._dependencies
+        dependency_count = len(dependencies)
+        if dependency_count and dependency_count < 3:
+            types = ';'.join([t.__name__ for t in dependencies])
             types = f'dependency_type={types}'
         else:
-            types = f'dependency_count={len(types_list)}'
+            types = f'dependency_count={dependency_count}'
 
         str = f"XContext(name='{self.name}', {types}"
         if include_parent:
@@ -1334,17 +1496,55 @@ class XContext:
             up next time they are asked for.
         """
         self._cached_context_chain = None
-        self._cached_parent_dependencies.clear()
+        self._cached_parent_dependencies = None
+        self._lookup = self._dependencies
 
     def _remove_cached_dependency_and_in_children(self, dependency_type: Type):
-        self._cached_parent_dependencies.pop(dependency_type, None)
-        for child in self._children:
-            child._remove_cached_dependency_and_in_children(dependency_type)
+        if self._cached_parent_dependencies:
+            if self._cached_parent_dependencies.pop(dependency_type, None) is not None:
+                # Only remove from `_lookup` if it was a cached value from a parent;
+                # if it's one of our own dependencies it should stay.
+                if dependency_type not in self._dependencies:
+                    self._lookup.pop(dependency_type, None)
+        if self._children:
+            for child in self._children:
+                # A context caches a dependency from its parent-chain in every context between
+                # it and where it was found (see `XContext.dependency`); so if a child does not
+                # have it cached, none of the child's children have it cached through us either.
+                cached = child._cached_parent_dependencies
+                if cached and dependency_type in cached:
+                    child._remove_cached_dependency_and_in_children(dependency_type)
+
+    __slots__ = (
+        '_name_id',
+        '_name_suffix',
+        '_func',
+        '_parent',
+        '_dependencies',
+        '_lookup',
+        '_cached_parent_dependencies',
+        '_cached_context_chain',
+        '_children',
+        '_sibling',
+        '_reset_token',
+        '_reset_token_stack',
+        '_is_active',
+        '_is_root_context_for_app',
+        '_is_root_context_for_thread',
+        '_is_root_like_context',
+        '_originally_passed_none_for_parent',
+        # Only used when we are directly used as a decorator, ie: `@XContext`,
+        # for `__name__`, `__doc__`, `__wrapped__`, etc; copied from decorated function.
+        '__dict__',
+        '__weakref__',
+    )
 
-    _cached_context_chain = None
-    _cached_parent_dependencies: dict = None
+    _name_id: int
+    _name_suffix: Optional[str]
+    _cached_context_chain: Optional[List['XContext']]
+    _cached_parent_dependencies: Optional[Dict[Type[Any], Any]]
 
-    _is_active = False
+    _is_active: bool
     """ This means at some point in the past we were 'activated' via one of these methods:
 
         `with` or `@` or activating a `xinject.dependency.Dependency` via `@` or `with`.
@@ -1358,30 +1558,44 @@ class XContext:
         the parent-chain.  See `XContext.parent_chain`.
     """
 
-    _reset_token_stack: List[contextvars.Token] = None
-    _dependencies: Dict[Type[Any], Any] = None
+    _reset_token: Optional[contextvars.Token]
+    """ Token from most recent time we were entered, see `XContext._push_reset_token`. """
+
+    _reset_token_stack: Optional[List[contextvars.Token]]
+    """ Tokens from older, still active enterings; only allocated if we are entered while
+        already having a `XContext._reset_token`.
+    """
+    _dependencies: Dict[Type[Any], Any]
+
+    _lookup: Dict[Type[Any], Any]
+    """ Both our own `XContext._dependencies` and the `XContext._cached_parent_dependencies`
+        in one dict, so finding either only takes a single lookup.
 
-    _is_root_context_for_app = False
+        Until something from a parent is cached, this is the same dict object as
+        `XContext._dependencies` (so don't write into it directly, use `XContext.add`).
+    """
+
+    _is_root_context_for_app: bool
 
-    _is_root_context_for_thread: bool = False
+    _is_root_context_for_thread: bool
     """ If True, this XContext is the root-context for a thread
         (or if only one thread, the only root context).
         This is mostly here for debugging purposes.
     """
 
-    _is_root_like_context: bool = False
+    _is_root_like_context: bool
     """ If True, this context was originally created to be a root-like/root context.
         The REAL thread-root context will have this AND `XContext._is_root_context_for_thread`
         both set to True.
     """
 
-    _parent: 'Union[XContext, _TreatAsRootParent, None]' = None
-    _originally_passed_none_for_parent = True
+    _parent: 'Union[XContext, DefaultType, _TreatAsRootParentType, None]'
+    _originally_passed_none_for_parent: bool
     """ Used internally to know if None was passed as my parent value originally. """
 
-    _children: Set['XContext'] = None
+    _children: Optional[Set['XContext']]
 
-    _sibling: Optional['XContext'] = None
+    _sibling: Optional['XContext']
     """
     If a `XContext` is activated a second time (perhaps when a function is called recursively, etc)
     then it makes a shallow copy of self, and sets its self as the the XContext copy's sibling
@@ -1405,7 +1619,7 @@ class XContext:
     can be kept track of correctly along with any cached resources from the parent-chain.
     """
 
-    _func = None
+    _func: Optional[Callable]
     """ Used if XContext is used as a function decorator directly, ie:
 
         >>> @XContext
@@ -1432,6 +1646,15 @@ def _setup_blank_app_and_thread_root_contexts_globals():
     """
     global _app_root_context
     global _current_context_contextvar
+    global _get_current_context
+    global _set_current_context
+
+    # The current thread's `contextvars.Context` keeps a value for each ContextVar ever set in it,
+    # even after we replace the ContextVar below. Clear our value from the previous one, so the
+    # old thread-root context (and its parents/dependencies) can be garbage collected.
+    previous_contextvar = globals().get('_current_context_contextvar')
+    if previous_contextvar is not None:
+        previous_contextvar.set(None)
 
     _app_root_context = XContext(parent=_TreatAsRootParent, name='AppRoot')
     _app_root_context._make_current_and_get_reset_token(is_app_root_context=True)
@@ -1440,12 +1663,23 @@ def _setup_blank_app_and_thread_root_contexts_globals():
     # as a ContextManager/ContextDecorator to get/set current context.
     #
     # This is used to keep track of the current context when using a XContext as a ContextManager.
+    #
+    # A new ContextVar each time (instead of resetting the value of a single one) is what blanks
+    # out every thread: other threads (ie: a thread-pool's workers that outlive a unit test) and
+    # asyncio tasks keep their own value for a ContextVar, which we can't reset from here.
+    # With a single ContextVar, they would keep using their old thread-root context
+    # (and its dependencies) after we are called.
 
     _current_context_contextvar = contextvars.ContextVar(
         'py-xinject-current_context',
         default=None
     )
 
+    # Bound methods of the above ContextVar, used on the hot paths (ie: `XContext.grab`),
+    # so they don't have to look up the method on the ContextVar each time.
+    _get_current_context = _current_context_contextvar.get
+    _set_current_context = _current_context_contextvar.set
+
 
 # Setup initial global XContext objects/state/containers:
 _setup_blank_app_and_thread_root_contexts_globals()
@@ -1453,3 +1687,9 @@ _setup_blank_app_and_thread_root_contexts_globals()
 # These are globals that should be here at this point:
 _app_root_context: XContext
 _current_context_contextvar: contextvars.ContextVar[Optional[XContext]]
+_get_current_context: Callable[[], Optional[XContext]]
+_set_current_context: Callable[[XContext], contextvars.Token]
+
+# Imported last, as `xinject.dependency` imports `XContext` from us;
+# we only need it once someone asks for a dependency (in `XContext.dependency`).
+from xinject.dependency import is_dependency_thread_sharable  # noqa: E402
@@ -127,10 +127,14 @@ For more info/details see:
 
 """
 import functools
-from typing import TypeVar, Iterable, Type, List, Generic, Callable, Any, Optional, Dict, Set
+from typing import (
+    TypeVar, Iterable, Type, List, Generic, Callable, Any, Optional, Dict, FrozenSet, Set, Union
+)
 from copy import copy, deepcopy
+from operator import attrgetter
 from xsentinels import Default
-from xinject import XContext, _private
+from xinject import context as _context_module
+from xinject.context import XContext
 from xinject.errors import XInjectError
 import sys
 
@@ -160,13 +164,41 @@ else:
 
 
 def is_dependency_thread_sharable(dependency: 'Dependency') -> bool:
-    # noinspection PyProtectedMember
-    return dependency._dependency__meta.get('thread_sharable', True)
+    """ Returns if `dependency` (a `Dependency` subclass or instance) can be shared between
+        threads.
+
+        Types that are not a `Dependency` subclass (ie: `int`) are considered thread-sharable,
+        so when one is asked for and not found, it's created in (and shared from) the app-root
+        context. This used to raise an `AttributeError` for them instead.
+    """
+    return getattr(dependency, '_dependency__thread_sharable', True)
 
 
 def attributes_to_skip_while_copying(dependency: 'Dependency') -> Set[str]:
+    # A new `set` each time, so callers can still modify what they are given.
+    # noinspection PyProtectedMember
+    return set(dependency._dependency__attributes_to_skip_while_copying)
+
+
+def _grab_dependency(dependency_type: Type[T]) -> T:
+    """ Does what `Dependency.grab` does; shared with `Dependency.obj`, so both are kept in sync.
+    """
+    # Same as `XContext.grab`, inlined as this is the hot path for getting a dependency.
+    # Looked up on the module each time, `_setup_blank_app_and_thread_root_contexts_globals`
+    # replaces it (along with the ContextVar it reads).
     # noinspection PyProtectedMember
-    return dependency._dependency__meta.get('attributes_to_skip_while_copying', set())
+    context = _context_module._get_current_context()
+    if context is None:
+        context = XContext.grab()
+
+    # Fast-path: dependency is in (or cached by) the current context,
+    # no need to call into the general `XContext.dependency` lookup.
+    # noinspection PyProtectedMember
+    obj = context._lookup.get(dependency_type)
+    if obj is not None:
+        return obj
+
+    return context.dependency(for_type=dependency_type)
 
 
 class Dependency:
@@ -406,10 +438,24 @@ class Dependency:
         super().__init_subclass__(**kwargs)
         parent_meta_dict = cls._dependency__meta
 
+        if (
+            parent_meta_dict is not None
+            and thread_sharable is Default
+            and attributes_to_skip_while_copying is Default
+        ):
+            # Nothing changed from our parent; we simply inherit its meta-dict
+            # along with the class attributes resolved from it (below).
+            return
+
         if parent_meta_dict is None:
             meta_dict = {'attributes_to_skip_while_copying': set()}
         else:
-            meta_dict = deepcopy(parent_meta_dict)
+            # The set is the only mutable value in the meta-dict; copy it so we don't alter
+            # our parent's set of attributes to skip.
+            meta_dict = dict(parent_meta_dict)
+            meta_dict['attributes_to_skip_while_copying'] = set(
+                parent_meta_dict['attributes_to_skip_while_copying']
+            )
 
         cls._dependency__meta = meta_dict
 
@@ -420,7 +466,23 @@ class Dependency:
             attr_set: set = meta_dict['attributes_to_skip_while_copying']
             attr_set.update(attributes_to_skip_while_copying)
 
+        # Resolved once here from the meta-dict, so they can be read directly off the class
+        # (see `is_dependency_thread_sharable` and `attributes_to_skip_while_copying`).
+        cls._dependency__thread_sharable = meta_dict.get('thread_sharable', True)
+        cls._dependency__attributes_to_skip_while_copying = frozenset(
+            meta_dict['attributes_to_skip_while_copying']
+        )
+        cls._dependency__copy_skip_attributes = frozenset(
+            ['_context_manager_stack', *meta_dict['attributes_to_skip_while_copying']]
+        )
+
     _dependency__meta = None
+    _dependency__thread_sharable = True
+    _dependency__attributes_to_skip_while_copying: FrozenSet[str] = frozenset()
+    _dependency__copy_skip_attributes: FrozenSet[str] = frozenset(['_context_manager_stack'])
+    """ `_dependency__attributes_to_skip_while_copying` plus `_context_manager_stack`,
+        which we always skip; used by `Dependency.__copy__` and `Dependency.__deepcopy__`.
+    """
 
     obj: Self
     """
@@ -441,7 +503,7 @@ class Dependency:
     Background Details (only if interested in implementation details):
 
     This is implemented via a `setattr` later on in the module that sets a
-    `_private.classproperty.classproperty` on it. This is a private class and should not be
+    `_GrabClassProperty` on it. This is a private class and should not be
     used outside. I use a `setattr` to try and hide from IDE that a classproperty is being used,
     which can add confusing details to the resulting type-hint the IDE comes up with for `.obj`.
 
@@ -469,7 +531,7 @@ class Dependency:
         ...         pass
         >>> SomeResourceManager.obj.get_resource_via("some-key-or-value")
         """
-        return XContext.grab().dependency(for_type=cls)
+        return _grab_dependency(cls)
 
     @classmethod
     def proxy(cls: Type[R], ) -> R:
@@ -481,9 +543,15 @@ class Dependency:
         >>> # `requested_attribute` is the original attribute being requested
         >>> # on returned proxy object.
         >>> return getattr(cls.grab(), requested_attribute)
+
+        The same proxy-object is returned each time it's called on the same class.
         """
-        from .proxy import CurrentDependencyProxy
-        return CurrentDependencyProxy.wrap(cls)
+        # Look in the class's own `__dict__`, a subclass should not get its parent's proxy.
+        proxy = cls.__dict__.get('_dependency__proxy')
+        if proxy is None:
+            proxy = CurrentDependencyProxy.wrap(cls)
+            cls._dependency__proxy = proxy
+        return proxy
 
     @classmethod
     def proxy_attribute(cls, attribute_name: str) -> Any:
@@ -495,13 +563,32 @@ class Dependency:
         >>> # `requested_attribute` is the original attribute being requested
         >>> # on returned proxy object.
         >>> return getattr(getattr(cls.grab(), attribute_name), requested_attribute)
+
+        The same proxy-object is returned each time it's called on the same class
+        with the same `attribute_name`.
         """
-        from .proxy import CurrentDependencyProxy
-        return CurrentDependencyProxy(
-            dependency_type=cls,
-            grabber=lambda x: getattr(x, attribute_name),
-            repr_info=f'attr:{attribute_name}'
-        )
+        # Look in the class's own `__dict__`, a subclass should not get its parent's proxies.
+        proxies = cls.__dict__.get('_dependency__attribute_proxies')
+        if proxies is None:
+            proxies = cls._dependency__attribute_proxies = {}
+
+        proxy = proxies.get(attribute_name)
+        if proxy is None:
+            if '.' in attribute_name:
+                # `attrgetter` would follow a dotted name as nested attributes;
+                # keep looking up the name as a single attribute (like `getattr` does).
+                def grabber(x):
+                    return getattr(x, attribute_name)
+            else:
+                # Implemented in C, no Python-level frame when called.
+                grabber = attrgetter(attribute_name)
+
+            proxy = proxies[attribute_name] = CurrentDependencyProxy._specialize(
+                dependency_type=cls,
+                grabber=grabber,
+                repr_info=f'attr:{attribute_name}'
+            )
+        return proxy
 
     def __copy__(self):
         """
@@ -528,23 +615,24 @@ class Dependency:
         dict_copy = self.__dict__.copy()
 
         # Pop out of the dict-copy any attributes we should skip.
-        attrs_to_skip = attributes_to_skip_while_copying(self) or []
-        for attr_to_skip in ['_context_manager_stack', *attrs_to_skip]:
+        for attr_to_skip in self._dependency__copy_skip_attributes:
             dict_copy.pop(attr_to_skip, None)
 
         for k, v in dict_copy.items():
-            if isinstance(v, (list, dict)):
+            value_type = type(v)
+            if value_type is list or value_type is dict:
+                dict_copy[k] = v.copy()
+            elif isinstance(v, (list, dict)):
+                # Subclasses (ie: `defaultdict`) may need their own copy logic.
                 dict_copy[k] = copy(v)
         clone.__dict__.update(dict_copy)
         return clone
 
     def __deepcopy__(self, memo=None):
-        # Collect a list of things to skip....
-        # We always need to have `_context_manager_stack`, subclasses can set
+        # Things to skip....
+        # We always need to skip `_context_manager_stack`, subclasses can set
         # `attributes_to_skip_while_copying` if they have additional ones they want to skip.
-        skip_attributes = {
-            x for x in ['_context_manager_stack', *(attributes_to_skip_while_copying(self) or [])]
-        }
+        skip_attributes = self._dependency__copy_skip_attributes
 
         # If we get called without a memo, allocate a blank dict.
         if memo is None:
@@ -561,28 +649,39 @@ class Dependency:
         memo[id(self)] = copy
 
         # Deepcopy everything except the ones user wants to ignore.
+        copy_dict = copy.__dict__
         for k, v in self.__dict__.items():
+            if k in skip_attributes:
+                continue
             try:
-                if k in skip_attributes:
-                    continue
-                copy.__dict__[k] = deepcopy(v, memo)
+                copy_dict[k] = deepcopy(v, memo)
             except TypeError:
-                continue  # Ignore type errors
+                # Values that can't be deep-copied (ie: a `threading.Lock`) are left out.
+                continue
 
         return copy
 
-    _context_manager_stack: List[XContext] = None
+    _context_manager_stack: Union[XContext, List[XContext], None] = None
     """ Keeps track of context's we created when self (ie: `Dependency`) is used in a `with`
         statement.  This MUST be reset when doing a copy of the dependency.
+
+        Most of the time we are only entered once at a time, so this is only a list if we are
+        entered again before exiting; otherwise it's the one context (or `None`).
     """
 
     def __enter__(self: R) -> R:
-        if self._context_manager_stack is None:
-            self._context_manager_stack = []
-
         # We make a new XContext object, and delegate context-management duties to it.
-        context = XContext(dependencies=self)
-        self._context_manager_stack.append(context)
+        # noinspection PyProtectedMember
+        context = XContext._new_blank().add(self)
+
+        stack = self._context_manager_stack
+        if stack is None:
+            self._context_manager_stack = context
+        elif type(stack) is list:
+            stack.append(context)
+        else:
+            self._context_manager_stack = [stack, context]
+
         context.__enter__()
         return self
 
@@ -596,7 +695,12 @@ class Dependency:
                 f"Indicates a very strange bug."
             )
 
-        context = stack.pop()
+        if type(stack) is list:
+            context = stack.pop()
+        else:
+            context = stack
+            self._context_manager_stack = None
+
         context.__exit__(*args, **kwargs)
 
     def __call__(self, func):
@@ -667,13 +771,33 @@ class Dependency:
         return wrapper
 
 
+_dependency_grab_function = Dependency.grab.__func__
+
+
+class _GrabClassProperty:
+    """
+    Class property used for `Dependency.obj`, returns the result of calling `grab()` on the
+    class it's asked on.
+
+    Unless a subclass overrides `Dependency.grab`, it calls what `Dependency.grab` calls
+    directly (`_grab_dependency`), since `obj` is frequently used to get the current dependency.
+    """
+
+    def __get__(self, instance, cls):
+        # Checked each time, so a `grab` replaced after the class is created (ie: a mock) is used.
+        grab = cls.grab
+        if getattr(grab, '__func__', None) is not _dependency_grab_function:
+            return grab()
+        return _grab_dependency(cls)
+
+
 # Keeps type-hinting in pycharm (and hopefully other IDE's) cleaner.
 # This is just an implementation detail, IDE should be using the explicit type-hints on class
 # to know what type the `obj` property/attribute will be.
 #
 # Details: We set a classproperty on `obj` that simply calls the `grab()` method on the
 #   Dependency subclass the user is asking for `obj` on and returns the result.
-setattr(Dependency, 'obj', _private.classproperty(fget=lambda cls: cls.grab()))
+setattr(Dependency, 'obj', _GrabClassProperty())
 
 
 class DependencyPerThread(Dependency, thread_sharable=False):
@@ -711,3 +835,8 @@ class DependencyPerThread(Dependency, thread_sharable=False):
     `xinject.context.XContext`.
     """
     pass
+
+
+# Imported last, as `xinject.proxy` imports `Dependency` from us;
+# only needed once `Dependency.proxy` or `Dependency.proxy_attribute` is called.
+from xinject.proxy import CurrentDependencyProxy  # noqa: E402
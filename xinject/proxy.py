@@ -14,11 +14,35 @@ See one of these for more details:
   (https://github.com/xyngular/py-xinject#active-dependecy-proxy#documentation)
 
 """
-from typing import TypeVar, Type, Generic, Callable, Any
+from typing import TypeVar, Type, Generic, Callable, Any, Optional, Dict, Tuple
+from weakref import WeakValueDictionary
 from .dependency import Dependency
 
 D = TypeVar('D')
 
+_proxy_intern: 'WeakValueDictionary[Any, CurrentDependencyProxy]' = WeakValueDictionary()
+"""
+Proxies created via `CurrentDependencyProxy.wrap`, keyed by `(proxy_class, dependency_type)`.
+
+Lets code that wraps the same dependency type in several places share a single proxy object.
+Values are weakly held, so a proxy is forgotten once nothing else refers to it.
+"""
+
+_specialized_types: 'Dict[Tuple[type, bool], Type[CurrentDependencyProxy]]' = {}
+"""
+Subclasses created by `CurrentDependencyProxy._specialize`, keyed by
+`(proxy_class, has_grabber)`.
+"""
+
+
+def _check_dependency_type(dependency_type: type):
+    # Would give unusual error later on, lets just check right now!
+    if not issubclass(dependency_type, Dependency):
+        raise Exception(
+            f"Must pass a xinject.Dependency subtype to xinject.ProxyActive.wrap, "
+            f"I was given a ({dependency_type}) instead."
+        )
+
 
 class CurrentDependencyProxy(Generic[D]):
     """
@@ -55,8 +79,23 @@ class CurrentDependencyProxy(Generic[D]):
     >>> from my_class_module import my_class
     >>>
     >>> my_class.my_method()
+
+    Each attribute access on the proxy looks up the current dependency again.
+    In a tight loop, grab the dependency once before the loop and use that directly:
+
+    >>> current_my_class = MyClass.grab()
+    >>> for _ in range(1000):
+    ...     current_my_class.my_method()
     """
 
+    # `__weakref__` is needed so `CurrentDependencyProxy.wrap` can weakly intern proxies.
+    __slots__ = ('_dependency_type', '_grabber', '_repr_info', '__weakref__')
+
+    def __class_getitem__(cls, item):
+        # `CurrentDependencyProxy[MyClass]` is only meaningful to type-checkers/IDE's;
+        # at runtime, skip building a typing alias object and simply hand back the class.
+        return cls
+
     @classmethod
     def wrap(cls, dependency_type: Type[D]) -> D:
         """ Just like init'ing a new object with `dependency_type`....
@@ -67,9 +106,101 @@ class CurrentDependencyProxy(Generic[D]):
 
             A simpler/alternate way to wrap a Dependency with a `CurrentDependencyProxy` is via the
             `xinject.dependency.Dependency.proxy` convenience method.
+
+            Wrapping the same `dependency_type` more than once will return the same proxy object,
+            as long as the previously returned proxy is still around (ie: referenced somewhere).
         """
-        # noinspection PyTypeChecker
-        return cls(dependency_type=dependency_type)
+        key = (cls, dependency_type)
+        proxy = _proxy_intern.get(key)
+        if proxy is None:
+            # noinspection PyTypeChecker
+            proxy = cls._specialize(dependency_type)
+            _proxy_intern[key] = proxy
+        return proxy
+
+    @classmethod
+    def _specialize(
+            cls, dependency_type: Type[D],
+            grabber: Callable[[D], Any] = None,
+            repr_info: str = None
+    ) -> 'CurrentDependencyProxy[D]':
+        """
+        Returns a new proxy for `dependency_type` and `grabber`, its type is a subclass of `cls`
+        with a `__getattribute__` and `_get_active` specialized for having a `grabber` or not.
+
+        The generated methods get the dependency type and grabber directly from our slots,
+        so each normal attribute access (and each `__setattr__`, `__repr__`, `__getitem__`, etc.)
+        does not go back through our own `__getattribute__` or check if there is a grabber to
+        call.
+
+        The subclasses are created once for `cls` (one with a grabber, one without),
+        and reused by every proxy after that.
+
+        `dependency_type.grab` is still looked up on each call, so a `grab` that is replaced
+        after the proxy is created (ie: a mock) is used.
+
+        If `cls` overrides `_get_active` or `__getattribute__`, a normal instance of `cls` is
+        returned instead, so those overrides are still used.
+
+        Args are the same as `CurrentDependencyProxy.__init__`.
+        """
+        if (
+            cls._get_active is not CurrentDependencyProxy._get_active
+            or cls.__getattribute__ is not CurrentDependencyProxy.__getattribute__
+        ):
+            proxy_type = cls
+        else:
+            key = (cls, grabber is not None)
+            proxy_type = _specialized_types.get(key)
+            if proxy_type is None:
+                # Check before creating anything for it.
+                _check_dependency_type(dependency_type)
+                proxy_type = _specialized_types[key] = cls._create_specialized_type(
+                    has_grabber=grabber is not None
+                )
+
+        if grabber is None and repr_info is None:
+            # Same as `wrap` has always done; a subclass's `__init__` may only take this.
+            return proxy_type(dependency_type=dependency_type)
+        return proxy_type(dependency_type=dependency_type, grabber=grabber, repr_info=repr_info)
+
+    @classmethod
+    def _create_specialized_type(cls, has_grabber: bool) -> 'Type[CurrentDependencyProxy]':
+        """ Creates the subclass of `cls` used by `CurrentDependencyProxy._specialize`. """
+        object_getattribute = object.__getattribute__
+
+        # Slot descriptors `__get__`, to read our slots without a `__getattribute__` call.
+        get_dependency_type = CurrentDependencyProxy._dependency_type.__get__
+        get_grabber = CurrentDependencyProxy._grabber.__get__
+
+        if has_grabber:
+            def _get_active(self):
+                return get_grabber(self)(get_dependency_type(self).grab())
+
+            def __getattribute__(self, name):
+                if name and name[0] == '_':
+                    return object_getattribute(self, name)
+                return getattr(get_grabber(self)(get_dependency_type(self).grab()), name)
+        else:
+            def _get_active(self):
+                return get_dependency_type(self).grab()
+
+            def __getattribute__(self, name):
+                if name and name[0] == '_':
+                    return object_getattribute(self, name)
+                return getattr(get_dependency_type(self).grab(), name)
+
+        return type(
+            f'{cls.__name__}[{"grabber" if has_grabber else "dependency"}]',
+            (cls,),
+            {
+                '__getattribute__': __getattribute__,
+                '_get_active': _get_active,
+                '_specialized_from': cls,
+                '__slots__': (),
+                '__module__': cls.__module__,
+            }
+        )
 
     def __init__(
             self, dependency_type: Type[D],
@@ -101,18 +232,29 @@ class CurrentDependencyProxy(Generic[D]):
                 `xinject.dependency.Dependency.proxy_attribute`.
         """
 
-        # Would give unusual error later on, lets just check right now!
-        if not issubclass(dependency_type, Dependency):
-            raise Exception(
-                f"Must pass a xinject.Dependency subtype to xinject.ProxyActive.wrap, "
-                f"I was given a ({dependency_type}) instead."
-            )
+        _check_dependency_type(dependency_type)
 
         self._dependency_type = dependency_type
         self._grabber = grabber
         self._repr_info = repr_info
         pass
 
+    # Set on the subclasses `CurrentDependencyProxy._specialize` creates, to the class
+    # they were created from (see `CurrentDependencyProxy.__reduce__`).
+    _specialized_from: 'Optional[Type[CurrentDependencyProxy]]' = None
+
+    def __reduce__(self):
+        # The subclasses `_specialize` creates can't be looked up by pickle (or copy);
+        # instead, rebuild an equal proxy via `_specialize` on the class it was created from.
+        grabber = self._grabber
+        repr_info = self._repr_info
+        if specialized_from := type(self)._specialized_from:
+            return specialized_from._specialize, (self._dependency_type, grabber, repr_info)
+        if grabber is None and repr_info is None:
+            # A subclass's `__init__` may only take `dependency_type` (see `_specialize`).
+            return type(self), (self._dependency_type,)
+        return type(self), (self._dependency_type, grabber, repr_info)
+
     def _get_active(self):
         # Get current/active instance of dependency type
         value = self._dependency_type.grab()
@@ -123,16 +265,18 @@ class CurrentDependencyProxy(Generic[D]):
     def __getattribute__(self, name):
         # Anything the starts with a `_` is something that we want to get/set on self,
         # and not on the current config object.
-        if name.startswith('_'):
-            return super().__getattribute__(name)
+        # (`name[0]` is cheaper than `name.startswith('_')`, and this is called a lot;
+        # `name and` keeps an empty name raising the normal `AttributeError`).
+        if name and name[0] == '_':
+            return object.__getattribute__(self, name)
 
         return getattr(self._get_active(), name)
 
     def __setattr__(self, key, value):
-        if key.startswith('_'):
+        if key and key[0] == '_':
             # Anything the starts with a `_` is something that we want to get/set on self,
             # and not on the current config object.
-            return super().__setattr__(key, value)
+            return object.__setattr__(self, key, value)
 
         # Otherwise, we set it on the current/active dependency object.
         return setattr(self._get_active(), key, value)
@@ -147,7 +291,7 @@ class CurrentDependencyProxy(Generic[D]):
         return self._get_active().__str__()
 
     def __getitem__(self, key):
-        return self._get_active().__getitem__(key)
+        return self._get_active()[key]
 
     def __setitem__(self, key, value):
-        return self._get_active().__setitem__(key, value)
+        self._get_active()[key] = value